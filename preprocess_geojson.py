@@ -130,13 +130,22 @@ Usage: python3 consolidate_overlays.py [output_directory]
 """
 
 import json
+import gzip
+import io
 import zlib
 import os
 import sys
 import math
 import shutil
+import heapq
+import pickle
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, redirect_stdout
+from functools import lru_cache
+from itertools import chain
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Iterable
 
 # Configuration - Edit these values as needed
 # TODO: Add validation that the config is valid for all required fields (rendering properties, file paths)
@@ -226,10 +235,11 @@ OVERLAYS = [
     # }
 ]
 
+@lru_cache(maxsize=64)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    """Convert hex color to RGB tuple (memoized; previews use only a handful of colors)."""
+    # Decode the RRGGBB bytes in one call; any trailing alpha digits are ignored as before
+    return tuple(bytes.fromhex(hex_color.lstrip('#')[:6]))
 
 def convert_rendering_to_geojson_style(rendering_config: Dict[str, Any]) -> Dict[str, Any]:
     """Convert internal rendering configuration to GeoJSON style properties."""
@@ -282,16 +292,28 @@ def generate_svg_preview(geojson_file: str, output_file: str, width: int = 800,
         width: SVG width in pixels
         height: SVG height in pixels
     """
-    print(f"Generating SVG preview: {geojson_file} -> {output_file}")
-
     # Load the GeoJSON data
     try:
-        with open(geojson_file, 'r', encoding='utf-8') as f:
-            geojson_data = json.load(f)
+        with open(geojson_file, 'rb') as f:
+            geojson_data = json.loads(f.read())
     except Exception as e:
         print(f"Error loading GeoJSON file: {e}")
         return
 
+    generate_svg_preview_from_data(geojson_data, output_file, width, height)
+
+def generate_svg_preview_from_data(geojson_data: Dict[str, Any], output_file: str, width: int = 800, height: int = 600):
+    """
+    Generate an SVG preview of already loaded GeoJSON data.
+
+    Args:
+        geojson_data: GeoJSON FeatureCollection
+        output_file: Path to output SVG file
+        width: SVG width in pixels
+        height: SVG height in pixels
+    """
+    print(f"Generating SVG preview: {output_file}")
+
     # Calculate bounds from GeoJSON features
     bounds = calculate_geojson_bounds(geojson_data)
     if not bounds:
@@ -301,89 +323,88 @@ def generate_svg_preview(geojson_file: str, output_file: str, width: int = 800,
     # Calculate scale and offset for SVG
     scale, offset_x, offset_y = calculate_transform(bounds, width, height)
 
-    # Generate SVG content
-    svg_content = generate_geojson_svg_content(geojson_data, bounds, scale, offset_x, offset_y, width, height)
-
-    # Write SVG file
+    # Generate and write the SVG, streaming fragments to a temporary file as they are produced.
+    # Only write errors are reported here; a failure while generating the SVG propagates, and
+    # either way the temporary file is removed so no partial SVG is left behind.
+    temp_file = f"{output_file}.tmp"
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
-        print(f"Successfully created SVG preview: {output_file}")
-    except Exception as e:
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.writelines(iter_geojson_svg_content(geojson_data, bounds, scale, offset_x, offset_y, width, height))
+        os.replace(temp_file, output_file)
+    except OSError as e:
         print(f"Error writing SVG file: {e}")
+        return
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
 
-def calculate_geojson_bounds(geojson_data: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
-    """Calculate the bounding box of GeoJSON features."""
-    min_lon, min_lat = float('inf'), float('inf')
-    max_lon, max_lat = float('-inf'), float('-inf')
-
-    for feature in geojson_data.get('features', []):
-        geometry = feature.get('geometry', {})
-        coordinates = geometry.get('coordinates', [])
-
-        # Extract coordinates based on geometry type
-        coords = extract_coordinates(coordinates, geometry.get('type', ''))
-
-        for coord in coords:
-            lon, lat = coord[0], coord[1]
-            min_lon = min(min_lon, lon)
-            max_lon = max(max_lon, lon)
-            min_lat = min(min_lat, lat)
-            max_lat = max(max_lat, lat)
+    print(f"Successfully created SVG preview: {output_file}")
 
-    if min_lon == float('inf'):
-        return None
+def is_feature_drawn(feature: Dict[str, Any]) -> bool:
+    """Check whether a feature draws anything in the SVG preview (visible, not fully transparent, has coordinates)."""
+    properties = feature.get('properties', {})
+    if not properties.get('visible', True) or not feature.get('geometry', {}).get('coordinates'):
+        return False
+    return properties.get('stroke-opacity', 1.0) != 0 or properties.get('fill-opacity', 0.0) != 0
 
-    return (min_lon, min_lat, max_lon, max_lat)
+def calculate_geojson_bounds(geojson_data: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
+    """Calculate the bounding box of the GeoJSON features drawn in the SVG preview."""
+    return calculate_features_bounds(
+        feature for feature in geojson_data.get('features', []) if is_feature_drawn(feature)
+    )
 
 def calculate_bounds(config: Dict[str, Any]) -> Optional[Tuple[float, float, float, float]]:
     """Calculate the bounding box of all overlays."""
+    return calculate_features_bounds(chain.from_iterable(
+        overlay.get('geojson', {}).get('features', []) for overlay in config.get('overlays', [])
+    ))
+
+def calculate_features_bounds(features: Iterable[Dict[str, Any]]) -> Optional[Tuple[float, float, float, float]]:
+    """Calculate the bounding box of a sequence of GeoJSON features."""
     min_lon, min_lat = float('inf'), float('inf')
     max_lon, max_lat = float('-inf'), float('-inf')
 
-    for overlay in config.get('overlays', []):
-        geojson = overlay.get('geojson', {})
-        for feature in geojson.get('features', []):
-            geometry = feature.get('geometry', {})
-            coordinates = geometry.get('coordinates', [])
+    for feature in features:
+        geometry = feature.get('geometry', {})
+        coordinates = geometry.get('coordinates', [])
 
-            # Extract coordinates based on geometry type
-            coords = extract_coordinates(coordinates, geometry.get('type', ''))
+        # Extract coordinates based on geometry type, as separate lon and lat columns
+        lons, lats = extract_coordinate_columns(coordinates, geometry.get('type', ''))
 
-            for coord in coords:
-                lon, lat = coord[0], coord[1]
-                min_lon = min(min_lon, lon)
-                max_lon = max(max_lon, lon)
-                min_lat = min(min_lat, lat)
-                max_lat = max(max_lat, lat)
+        # Reduce each column with the builtin min/max instead of comparing per point
+        if lons:
+            min_lon = min(min_lon, min(lons))
+            max_lon = max(max_lon, max(lons))
+            min_lat = min(min_lat, min(lats))
+            max_lat = max(max_lat, max(lats))
 
     if min_lon == float('inf'):
         return None
 
     return (min_lon, min_lat, max_lon, max_lat)
 
+# Flatten the coordinates of each geometry type into a list of coordinate pairs
+COORDINATE_EXTRACTORS = {
+    'Point': lambda coordinates: [coordinates],
+    'LineString': list,
+    'Polygon': lambda coordinates: [coord for ring in coordinates for coord in ring],
+    'MultiPoint': list,
+    'MultiLineString': lambda coordinates: [coord for line in coordinates for coord in line],
+    'MultiPolygon': lambda coordinates: [coord for polygon in coordinates for ring in polygon for coord in ring],
+}
+
 def extract_coordinates(coordinates: Any, geometry_type: str) -> List[List[float]]:
     """Extract all coordinate pairs from geometry."""
-    coords = []
+    extractor = COORDINATE_EXTRACTORS.get(geometry_type)
+    if extractor is None:
+        return []
 
-    if geometry_type == 'Point':
-        coords.append(coordinates)
-    elif geometry_type == 'LineString':
-        coords.extend(coordinates)
-    elif geometry_type == 'Polygon':
-        for ring in coordinates:
-            coords.extend(ring)
-    elif geometry_type == 'MultiPoint':
-        coords.extend(coordinates)
-    elif geometry_type == 'MultiLineString':
-        for line in coordinates:
-            coords.extend(line)
-    elif geometry_type == 'MultiPolygon':
-        for polygon in coordinates:
-            for ring in polygon:
-                coords.extend(ring)
+    return extractor(coordinates)
 
-    return coords
+def extract_coordinate_columns(coordinates: Any, geometry_type: str) -> Tuple[List[float], List[float]]:
+    """Extract all coordinates from geometry as separate (lons, lats) lists."""
+    coords = extract_coordinates(coordinates, geometry_type)
+    return [coord[0] for coord in coords], [coord[1] for coord in coords]
 
 def calculate_transform(bounds: Tuple[float, float, float, float], width: int, height: int) -> Tuple[float, float, float]:
     """Calculate scale and offset for transforming coordinates to SVG space."""
@@ -411,10 +432,15 @@ def calculate_transform(bounds: Tuple[float, float, float, float], width: int, h
 def generate_geojson_svg_content(geojson_data: Dict[str, Any], bounds: Tuple[float, float, float, float],
                                scale: float, offset_x: float, offset_y: float, width: int, height: int) -> str:
     """Generate the SVG content from GeoJSON data."""
+    return ''.join(iter_geojson_svg_content(geojson_data, bounds, scale, offset_x, offset_y, width, height))
+
+def iter_geojson_svg_content(geojson_data: Dict[str, Any], bounds: Tuple[float, float, float, float],
+                             scale: float, offset_x: float, offset_y: float, width: int, height: int) -> Iterator[str]:
+    """Yield the SVG content from GeoJSON data in fragments, so it can be written without building one string."""
     min_lon, min_lat, max_lon, max_lat = bounds
 
     # SVG header
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    yield f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <style>
@@ -434,10 +460,21 @@ def generate_geojson_svg_content(geojson_data: Dict[str, Any], bounds: Tuple[flo
   <!-- Features -->
 '''
 
+    # Group tags keyed by style; every feature of a layer shares one, so each is formatted once
+    group_tags = {}
+
+    # Consecutive features with the same layer and style share one <g>, which keeps
+    # the drawing order while avoiding a wrapper element per feature
+    current_group = None
+
     # Add each feature
     for feature in geojson_data.get('features', []):
+        # Skip features that would draw nothing: hidden, fully transparent or without coordinates
+        if not is_feature_drawn(feature):
+            continue
+
         properties = feature.get('properties', {})
-        geometry = feature.get('geometry', {})
+        geometry = feature['geometry']
 
         # Get styling from properties
         color = properties.get('stroke', properties.get('marker-color', '#000000'))
@@ -446,29 +483,39 @@ def generate_geojson_svg_content(geojson_data: Dict[str, Any], bounds: Tuple[flo
         fill_opacity = properties.get('fill-opacity', 0.0)
         fill_color = properties.get('fill', color)
 
-        # Convert hex to RGB for opacity
-        r, g, b = hex_to_rgb(color)
-        fill_r, fill_g, fill_b = hex_to_rgb(fill_color)
+        # Include the value types so e.g. 1 and 1.0 (equal, but formatted differently) get separate tags
+        style = (color, fill_color, opacity, thickness, fill_opacity, type(opacity), type(thickness), type(fill_opacity))
+        group_tag = group_tags.get(style)
+        if group_tag is None:
+            # Convert hex to RGB for opacity
+            r, g, b = hex_to_rgb(color)
+            fill_r, fill_g, fill_b = hex_to_rgb(fill_color)
+            group_tag = f'  <g class="feature" stroke="rgb({r},{g},{b})" stroke-opacity="{opacity}" stroke-width="{thickness}" fill="rgb({fill_r},{fill_g},{fill_b})" fill-opacity="{fill_opacity}">\n'
+            group_tags[style] = group_tag
 
         layer_name = properties.get('layer_name', 'Unknown')
-        svg += f'  <!-- {layer_name} -->\n'
-        svg += f'  <g class="feature" stroke="rgb({r},{g},{b})" stroke-opacity="{opacity}" stroke-width="{thickness}" fill="rgb({fill_r},{fill_g},{fill_b})" fill-opacity="{fill_opacity}">\n'
+        if (layer_name, group_tag) != current_group:
+            if current_group is not None:
+                yield '  </g>\n'
+            yield f'  <!-- {layer_name} -->\n'
+            yield group_tag
+            current_group = (layer_name, group_tag)
 
         # Add geometry
-        svg += generate_geometry_svg(geometry, scale, offset_x, offset_y, properties)
+        yield generate_geometry_svg(geometry, scale, offset_x, offset_y, properties)
 
-        svg += '  </g>\n'
+    if current_group is not None:
+        yield '  </g>\n'
 
-    svg += '</svg>'
-    return svg
+    yield '</svg>'
 
 def generate_svg_content(config: Dict[str, Any], bounds: Tuple[float, float, float, float],
                         scale: float, offset_x: float, offset_y: float, width: int, height: int) -> str:
     """Generate the SVG content."""
     min_lon, min_lat, max_lon, max_lat = bounds
 
-    # SVG header
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
+    # SVG header; fragments are collected in a list and joined once at the end
+    parts = [f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
   <defs>
     <style>
@@ -486,7 +533,7 @@ def generate_svg_content(config: Dict[str, Any], bounds: Tuple[float, float, flo
   </text>
 
   <!-- Overlays -->
-'''
+''']
 
     # Add each overlay
     for overlay in config.get('overlays', []):
@@ -499,18 +546,18 @@ def generate_svg_content(config: Dict[str, Any], bounds: Tuple[float, float, flo
         # Convert hex to RGB for opacity
         r, g, b = hex_to_rgb(color)
 
-        svg += f'  <!-- {overlay.get("name", "Unknown")} -->\n'
-        svg += f'  <g class="overlay" stroke="rgb({r},{g},{b})" stroke-opacity="{opacity}" stroke-width="{thickness}" fill="rgb({r},{g},{b})" fill-opacity="{fill_opacity}">\n'
+        parts.append(f'  <!-- {overlay.get("name", "Unknown")} -->\n')
+        parts.append(f'  <g class="overlay" stroke="rgb({r},{g},{b})" stroke-opacity="{opacity}" stroke-width="{thickness}" fill="rgb({r},{g},{b})" fill-opacity="{fill_opacity}">\n')
 
         # Add geometry
         geojson = overlay.get('geojson', {})
         for feature in geojson.get('features', []):
             geometry = feature.get('geometry', {})
-            svg += generate_geometry_svg(geometry, scale, offset_x, offset_y)
+            parts.append(generate_geometry_svg(geometry, scale, offset_x, offset_y))
 
-        svg += '  </g>\n'
+        parts.append('  </g>\n')
 
-    return svg
+    return ''.join(parts)
 
 def generate_geometry_svg(geometry: Dict[str, Any], scale: float, offset_x: float, offset_y: float, properties: Dict[str, Any] = {}) -> str:
     """Generate SVG path for a geometry."""
@@ -538,87 +585,79 @@ def transform_coord(lon: float, lat: float, scale: float, offset_x: float, offse
     y = -lat * scale + offset_y  # Flip Y axis
     return x, y
 
+def format_path_points(coordinates: List[List[float]], scale: float, offset_x: float, offset_y: float) -> str:
+    """
+    Transform coordinates to SVG space and join them into path points ("x,y L x,y ...").
+
+    The transform is the same as transform_coord, inlined so each vertex costs one
+    formatted string rather than a function call plus a tuple. Values are written
+    with 2 decimal places, which is well below a pixel at preview sizes.
+    """
+    return ' L '.join([
+        f"{coord[0] * scale + offset_x:.2f},{-coord[1] * scale + offset_y:.2f}"
+        for coord in coordinates
+    ])
+
+# Escapes for the special XML characters in SVG label text, applied in a single pass
+XML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&apos;'})
+
 def generate_point_svg(coordinates: List[float], scale: float, offset_x: float, offset_y: float, properties: Dict[str, Any] = {}) -> str:
-    """Generate SVG for a point with optional text label."""
+    """Generate SVG for a point with optional text label (positions rounded to 2 decimals like paths)."""
     x, y = transform_coord(coordinates[0], coordinates[1], scale, offset_x, offset_y)
-    svg = f'    <circle cx="{x}" cy="{y}" r="3"/>\n'
+    svg = f'    <circle cx="{x:.2f}" cy="{y:.2f}" r="3"/>\n'
 
     # Add text label if this is a CPN point
     if properties.get('layer_id') == 'cpns' and 'NAME' in properties:
         name = properties.get('NAME', '')
         # Escape special XML characters
-        name = name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&apos;')
+        name = name.translate(XML_ESCAPE_TABLE)
         # Position text slightly above the point
-        svg += f'    <text x="{x}" y="{y-5}" text-anchor="middle" font-size="8" fill="black">{name}</text>\n'
+        svg += f'    <text x="{x:.2f}" y="{y - 5:.2f}" text-anchor="middle" font-size="8" fill="black">{name}</text>\n'
 
     return svg
 
 def generate_linestring_svg(coordinates: List[List[float]], scale: float, offset_x: float, offset_y: float) -> str:
     """Generate SVG for a line string."""
-    points = []
-    for coord in coordinates:
-        x, y = transform_coord(coord[0], coord[1], scale, offset_x, offset_y)
-        points.append(f"{x},{y}")
-
-    path_data = f"M {' L '.join(points)}"
+    path_data = f"M {format_path_points(coordinates, scale, offset_x, offset_y)}"
     return f'    <path d="{path_data}"/>\n'
 
 def generate_polygon_svg(coordinates: List[List[List[float]]], scale: float, offset_x: float, offset_y: float) -> str:
     """Generate SVG for a polygon."""
-    svg = ''
-    for ring in coordinates:
-        points = []
-        for coord in ring:
-            x, y = transform_coord(coord[0], coord[1], scale, offset_x, offset_y)
-            points.append(f"{x},{y}")
-
-        path_data = f"M {' L '.join(points)} Z"
-        svg += f'    <path d="{path_data}"/>\n'
-
-    return svg
+    return ''.join([
+        f'    <path d="M {format_path_points(ring, scale, offset_x, offset_y)} Z"/>\n'
+        for ring in coordinates
+    ])
 
 def generate_multipoint_svg(coordinates: List[List[float]], scale: float, offset_x: float, offset_y: float, properties: Dict[str, Any] = {}) -> str:
     """Generate SVG for multiple points."""
-    svg = ''
+    parts = []
     for coord in coordinates:
         x, y = transform_coord(coord[0], coord[1], scale, offset_x, offset_y)
-        svg += f'    <circle cx="{x}" cy="{y}" r="3"/>\n'
+        parts.append(f'    <circle cx="{x:.2f}" cy="{y:.2f}" r="3"/>\n')
 
         # Add text label if this is a CPN point
         if properties.get('layer_id') == 'cpns' and 'NAME' in properties:
             name = properties.get('NAME', '')
             # Escape special XML characters
-            name = name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&apos;')
+            name = name.translate(XML_ESCAPE_TABLE)
             # Position text slightly above the point
-            svg += f'    <text x="{x}" y="{y-5}" text-anchor="middle" font-size="10" fill="black">{name}</text>\n'
-    return svg
+            parts.append(f'    <text x="{x:.2f}" y="{y - 5:.2f}" text-anchor="middle" font-size="10" fill="black">{name}</text>\n')
+    return ''.join(parts)
 
 def generate_multilinestring_svg(coordinates: List[List[List[float]]], scale: float, offset_x: float, offset_y: float) -> str:
     """Generate SVG for multiple line strings."""
-    svg = ''
-    for line in coordinates:
-        points = []
-        for coord in line:
-            x, y = transform_coord(coord[0], coord[1], scale, offset_x, offset_y)
-            points.append(f"{x},{y}")
-
-        path_data = f"M {' L '.join(points)}"
-        svg += f'    <path d="{path_data}"/>\n'
-    return svg
+    return ''.join([
+        f'    <path d="M {format_path_points(line, scale, offset_x, offset_y)}"/>\n'
+        for line in coordinates
+    ])
 
 def generate_multipolygon_svg(coordinates: List[List[List[List[float]]]], scale: float, offset_x: float, offset_y: float) -> str:
     """Generate SVG for multiple polygons."""
-    svg = ''
-    for polygon in coordinates:
-        for ring in polygon:
-            points = []
-            for coord in ring:
-                x, y = transform_coord(coord[0], coord[1], scale, offset_x, offset_y)
-                points.append(f"{x},{y}")
-
-            path_data = f"M {' L '.join(points)} Z"
-            svg += f'    <path d="{path_data}"/>\n'
-    return svg
+    return ''.join([
+        f'    <path d="M {format_path_points(ring, scale, offset_x, offset_y)} Z"/>\n'
+        for polygon in coordinates
+        for ring in polygon
+    ])
 
 def load_license_and_attribution():
     """Load license and attribution information from files."""
@@ -639,8 +678,38 @@ def load_license_and_attribution():
 
     return license_text, attribution_text
 
-def consolidate_overlays(output_dir: str):
-    """Consolidate multiple GeoJSON files into a single GeoJSON file with embedded styling."""
+# Shared compact encoder; json.dumps builds a new JSONEncoder on every call with non-default options
+COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+def iter_feature_collection_json(feature_collection: Dict[str, Any]) -> Iterator[str]:
+    """
+    Yield the compact JSON encoding of a FeatureCollection in chunks.
+
+    The concatenated chunks are identical to json.dumps(feature_collection, separators=(',', ':')),
+    but each feature is serialized on its own so the full document is never held as one string.
+    """
+    encode = COMPACT_JSON_ENCODER.encode
+
+    yield '{'
+    for index, (key, value) in enumerate(feature_collection.items()):
+        prefix = ',' if index else ''
+        if key == 'features':
+            yield prefix + '"features":['
+            for feature_index, feature in enumerate(value):
+                yield (',' if feature_index else '') + encode(feature)
+            yield ']'
+        else:
+            yield prefix + encode(key) + ':' + encode(value)
+    yield '}'
+
+def consolidate_overlays(output_dir: str, compress: bool = True):
+    """
+    Consolidate multiple GeoJSON files into a single GeoJSON file with embedded styling.
+
+    Args:
+        output_dir: Directory to write the consolidated files to (cleared first)
+        compress: Also write a gzipped copy of each consolidated file as <name>.geojson.gz
+    """
     # Clear and create output directory
     if os.path.exists(output_dir):
         shutil.rmtree(output_dir)
@@ -676,69 +745,147 @@ def consolidate_overlays(output_dir: str):
 
         total_features = 0
 
-        for layer_id, layer_config in layers.items():
+        # Load and preprocess GeoJSON for all layers in parallel worker processes.
+        # Layers are independent; map() returns results in layer order. Each layer's
+        # output is captured and printed below its own header.
+        layer_configs = list(layers.values())
+        filepaths = [layer_config["inputFile"] for layer_config in layer_configs]
+        worker_count = min(len(layer_configs), os.cpu_count() or 1)
+        if worker_count > 1:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                layer_results = list(executor.map(load_and_preprocess_geojson_captured, filepaths, layer_configs))
+        else:
+            # Single layer or single core: a worker process would only add overhead
+            layer_results = list(map(load_and_preprocess_geojson_captured, filepaths, layer_configs))
+
+        for (layer_id, layer_config), (geojson_data, layer_log) in zip(layers.items(), layer_results):
             filepath = layer_config["inputFile"]
             print(f"  Processing {layer_id} from {filepath}")
+            print(layer_log, end='')
 
-            # Load and preprocess GeoJSON
-            geojson_data = load_and_preprocess_geojson(filepath, layer_config)
             if not geojson_data:
                 print(f"Error: Failed to load {filepath}")
                 exit(1)
 
-            feature_count = len(geojson_data.get('features', []))
+            features = geojson_data.get('features', [])
+            feature_count = len(features)
             total_features += feature_count
             print(f"    Loaded {feature_count} features")
 
-            # Add styling properties to each feature based on rendering config
-            styling_properties = convert_rendering_to_geojson_style(layer_config["rendering"])
-
-            for feature in geojson_data.get('features', []):
-                # Ensure properties object exists
-                if 'properties' not in feature:
-                    feature['properties'] = {}
-
-                # Add layer metadata
-                feature['properties']['layer_id'] = layer_id
-                feature['properties']['layer_name'] = layer_config["name"]
-                feature['properties']['description'] = layer_config["description"]
+            # Build the layer metadata and styling properties (from rendering config) once per layer
+            layer_properties = {
+                'layer_id': layer_id,
+                'layer_name': layer_config["name"],
+                'description': layer_config["description"],
+                **convert_rendering_to_geojson_style(layer_config["rendering"])
+            }
 
-                # Add styling properties
-                feature['properties'].update(styling_properties)
+            consolidated_features = consolidated_geojson['features']
+            for feature in features:
+                # Add layer metadata and styling properties in a single merge
+                feature['properties'] = {**feature.get('properties', {}), **layer_properties}
 
                 # Add to consolidated collection
-                consolidated_geojson['features'].append(feature)
+                consolidated_features.append(feature)
 
         print(f"  Consolidated {len(layers)} layers with {total_features} total features")
 
-        # Write consolidated GeoJSON file
+        # Write consolidated GeoJSON file (and its gzipped copy), one feature at a time
         output_file = os.path.join(output_dir, f"{overlay_name}.geojson")
-        json_str = json.dumps(consolidated_geojson, separators=(',', ':'))
-        file_size = len(json_str.encode('utf-8'))
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(json_str)
+        compressed_file = f"{output_file}.gz"
+        with ExitStack() as stack:
+            f = stack.enter_context(open(output_file, 'wb', buffering=1 << 20))
+            outputs = [f]
+            if compress:
+                # Batch the small per-feature chunks so zlib compresses them in 64 KB blocks
+                # A fixed header mtime keeps the .gz byte-identical across runs with the same input
+                gzip_file = stack.enter_context(gzip.GzipFile(compressed_file, 'wb', compresslevel=6, mtime=0))
+                outputs.append(stack.enter_context(io.BufferedWriter(gzip_file, buffer_size=1 << 16)))
+
+            for chunk in iter_feature_collection_json(consolidated_geojson):
+                data = chunk.encode('utf-8')
+                for output in outputs:
+                    output.write(data)
+            file_size = f.tell()
 
         print(f"  Successfully created {output_file} ({file_size:,} bytes)")
+        if compress:
+            compressed_size = os.path.getsize(compressed_file)
+            print(f"  Successfully created {compressed_file} ({compressed_size:,} bytes, {compressed_size / file_size:.1%} of uncompressed)")
 
-        # generate svg preview
+        # generate svg preview from the in-memory collection instead of re-reading the file just written
         svg_output_file = os.path.join(output_dir, f"{overlay_name}.svg")
-        generate_svg_preview(output_file, svg_output_file)
+        generate_svg_preview_from_data(consolidated_geojson, svg_output_file)
 
         total_files_processed += 1
         total_features_processed += total_features
 
     print(f"\nCompleted processing {total_files_processed} GeoJSON files with {total_features_processed} total features")
 
+# Preprocessed layers are cached here between runs (set to None to disable)
+PREPROCESS_CACHE_DIR = "./.cache/preprocess"
+
+def preprocess_cache_path(filepath: str) -> str:
+    """
+    Get the cache file for a preprocessed layer.
+
+    There is one file per input path, overwritten whenever the layer is reprocessed,
+    so stale results never accumulate in the cache directory.
+    """
+    name = hashlib.blake2s(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+    return os.path.join(PREPROCESS_CACHE_DIR, f"{name}.pickle")
+
+def preprocess_cache_key(filepath: str, input_stat: os.stat_result, layer_config: Dict[str, Any]) -> str:
+    """
+    Get the key a cached layer must match to be reused.
+
+    The key covers the input file (path, mtime and size), the layer configuration and
+    this script itself, so editing any of them invalidates the cached result.
+    """
+    script_stat = os.stat(__file__)
+    key_source = json.dumps([
+        os.path.abspath(filepath), input_stat.st_mtime_ns, input_stat.st_size,
+        script_stat.st_mtime_ns, script_stat.st_size, layer_config
+    ], sort_keys=True)
+    return hashlib.blake2s(key_source.encode('utf-8')).hexdigest()
+
 def load_and_preprocess_geojson(filepath: str, layer_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Load and preprocess a GeoJSON file."""
-    if not os.path.exists(filepath):
+    """Load and preprocess a GeoJSON file, reusing the cached result if the input is unchanged."""
+    # A single stat both checks that the file exists and provides the cache key
+    try:
+        input_stat = os.stat(filepath)
+    except FileNotFoundError:
         print(f"Error: File not found: {filepath}")
         return None
+    except OSError as e:
+        print(f"Error loading {filepath}: {e}")
+        return None
+
+    cache_path = None
+    if PREPROCESS_CACHE_DIR:
+        cache_path = preprocess_cache_path(filepath)
+        try:
+            cache_key = preprocess_cache_key(filepath, input_stat, layer_config)
+        except Exception as e:
+            # e.g. a layer config value that is not JSON serializable; load without the cache
+            print(f"Warning: Not caching {filepath}: {e}")
+            cache_path = None
+
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, cached_data = pickle.load(f)
+            if cached_key == cache_key:
+                return cached_data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache {cache_path}: {e}")
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Parse the raw bytes; json decodes UTF-8 itself, skipping the text-mode decoder
+        with open(filepath, 'rb') as f:
+            data = json.loads(f.read())
 
         # Validate GeoJSON structure
         if data.get('type') != 'FeatureCollection':
@@ -752,12 +899,44 @@ def load_and_preprocess_geojson(filepath: str, layer_config: Dict[str, Any]) ->
 
         # Apply preprocessing
         processed_data = preprocess_geojson(data, layer_config)
+
+        if cache_path:
+            save_preprocess_cache(cache_path, cache_key, processed_data)
+
         return processed_data
 
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         return None
 
+def load_and_preprocess_geojson_captured(filepath: str, layer_config: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Run load_and_preprocess_geojson with its output captured.
+
+    Returns:
+        Tuple of (preprocessed GeoJSON or None, printed output), so that the caller can
+        print each layer's messages under its header even when layers load in parallel
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        geojson_data = load_and_preprocess_geojson(filepath, layer_config)
+    return geojson_data, output.getvalue()
+
+def save_preprocess_cache(cache_path: str, cache_key: str, processed_data: Dict[str, Any]):
+    """Write a preprocessed layer to the cache; failures only cost the cache hit next run."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a temporary file first so a concurrent or interrupted run never sees a partial cache
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump((cache_key, processed_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}")
+
+# Geometry types kept by preprocess_geojson; everything else (e.g. GeometryCollection) is dropped
+SUPPORTED_GEOMETRY_TYPES = frozenset(['Point', 'LineString', 'Polygon', 'MultiPoint', 'MultiLineString', 'MultiPolygon'])
+
 def preprocess_geojson(data: Dict[str, Any], layer_config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Preprocess GeoJSON data to reduce file size and normalize format.
@@ -766,44 +945,52 @@ def preprocess_geojson(data: Dict[str, Any], layer_config: Dict[str, Any]) -> Di
     - Truncate coordinates to 5 decimal places (~1m precision)
     - Remove unnecessary properties
     - Filter to only LineString and Polygon geometries
-    - Apply simplification based on layer configuration
+    - Apply simplification based on layer configuration ("simplificationStrategy",
+      "simplificationTolerance" and, for Douglas-Peucker, an optional per-ring
+      "simplificationMaxVertices" cap)
     """
     processed_features = []
 
-    # Get simplification strategy and tolerance
+    # Get simplification strategy, tolerance and vertex cap
     strategy = layer_config.get("simplificationStrategy", "none")
     tolerance = layer_config.get("simplificationTolerance", 0.0)
+    max_vertices = layer_config.get("simplificationMaxVertices")
     no_compression = layer_config.get("noCompression", False)
 
+    # A cap must keep at least both endpoints of a line (polygon rings are raised to 4 later)
+    if max_vertices is not None and (isinstance(max_vertices, bool) or not isinstance(max_vertices, int) or max_vertices < 2):
+        raise ValueError(f"simplificationMaxVertices must be an integer >= 2, got {max_vertices!r}")
+
+    # Pick the geometry pipeline once per layer rather than re-testing the strategy per feature.
+    # Simplification comes FIRST, THEN coordinates are truncated to 5 decimal places (final step).
+    if no_compression:
+        # Disable all simplification - keep original geometry
+        process_geometry = truncate_coordinates
+    elif strategy == "rectangle":
+        # Use rectangle simplification (simplify_to_rectangle leaves non-polygons unchanged)
+        process_geometry = lambda geometry: truncate_coordinates(simplify_to_rectangle(geometry))
+    elif strategy == "douglas_peucker" and (tolerance > 0 or max_vertices is not None):
+        # Use Douglas-Peucker simplification, truncating each ring as it is simplified
+        process_geometry = lambda geometry: simplify_and_truncate_geometry(geometry, tolerance, max_vertices)
+    else:
+        # No simplification
+        process_geometry = truncate_coordinates
+
     for feature in data.get('features', []):
         geometry = feature.get('geometry', {})
-        geometry_type = geometry.get('type', '')
 
-        # Filter to only supported geometry types
-        if geometry_type not in ['Point', 'LineString', 'Polygon', 'MultiPoint', 'MultiLineString', 'MultiPolygon']:
+        # Filter to only supported geometry types before doing any work on the feature
+        if geometry.get('type', '') not in SUPPORTED_GEOMETRY_TYPES:
             continue
 
-        # Apply simplification FIRST (before coordinate truncation)
-        if no_compression:
-            # Disable all simplification - keep original geometry
-            simplified_geometry = geometry
-        elif strategy == "rectangle" and geometry_type in ['Polygon', 'MultiPolygon']:
-            # Use rectangle simplification
-            simplified_geometry = simplify_to_rectangle(geometry)
-        elif strategy == "douglas_peucker" and tolerance > 0:
-            # Use Douglas-Peucker simplification
-            simplified_geometry = simplify_geometry(geometry, tolerance)
-        else:
-            # No simplification
-            simplified_geometry = geometry
-
-        # THEN truncate coordinates to 5 decimal places (final step)
-        truncated_geometry = truncate_coordinates(simplified_geometry)
+        truncated_geometry = process_geometry(geometry)
 
         processed_feature = {
             'type': 'Feature',
             'geometry': truncated_geometry,
-            'properties': feature.get('properties', {}).copy()  # Preserve original properties
+            # Preserve original properties; shared rather than copied, since the input data is discarded
+            # after preprocessing and consolidate_overlays merges into a new dict instead of mutating
+            'properties': feature.get('properties') or {}
         }
 
         # Include ID if present
@@ -817,13 +1004,15 @@ def preprocess_geojson(data: Dict[str, Any], layer_config: Dict[str, Any]) -> Di
         'features': processed_features
     }
 
-def simplify_geometry(geometry: Dict[str, Any], tolerance: float) -> Dict[str, Any]:
+def simplify_geometry(geometry: Dict[str, Any], tolerance: float, max_vertices: Optional[int] = None) -> Dict[str, Any]:
     """
     Simplify geometry using Douglas-Peucker algorithm to reduce point count.
 
     Args:
         geometry: GeoJSON geometry object
         tolerance: Simplification tolerance in degrees (default: 0.000001 ~ 0.11m)
+        max_vertices: Optional maximum number of points to keep per line/ring
+            (at least 4 for polygon rings, so they stay valid closed rings)
 
     Returns:
         Simplified geometry object
@@ -835,32 +1024,90 @@ def simplify_geometry(geometry: Dict[str, Any], tolerance: float) -> Dict[str, A
         return geometry
 
     simplified_geometry = geometry.copy()
+    ring_max_vertices = polygon_ring_vertex_cap(max_vertices)
 
     if geometry_type == 'LineString':
-        simplified_geometry['coordinates'] = douglas_peucker(coordinates, tolerance)
+        simplified_geometry['coordinates'] = douglas_peucker(coordinates, tolerance, max_vertices)
     elif geometry_type == 'Polygon':
         simplified_geometry['coordinates'] = [
-            douglas_peucker(ring, tolerance) for ring in coordinates
+            douglas_peucker(ring, tolerance, ring_max_vertices) for ring in coordinates
         ]
     elif geometry_type == 'MultiLineString':
         simplified_geometry['coordinates'] = [
-            douglas_peucker(line, tolerance) for line in coordinates
+            douglas_peucker(line, tolerance, max_vertices) for line in coordinates
         ]
     elif geometry_type == 'MultiPolygon':
         simplified_geometry['coordinates'] = [
-            [douglas_peucker(ring, tolerance) for ring in polygon]
+            [douglas_peucker(ring, tolerance, ring_max_vertices) for ring in polygon]
             for polygon in coordinates
         ]
 
     return simplified_geometry
 
-def douglas_peucker(points: List[List[float]], tolerance: float) -> List[List[float]]:
+def simplify_and_truncate_geometry(geometry: Dict[str, Any], tolerance: float,
+                                   max_vertices: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Simplify geometry with Douglas-Peucker and truncate it to 5 decimal places in one pass.
+
+    Equivalent to truncate_coordinates(simplify_geometry(geometry, tolerance, max_vertices)), but each
+    ring is rounded right after it is simplified, so only the kept points are visited
+    and no intermediate simplified geometry is built.
+
+    Args:
+        geometry: GeoJSON geometry object
+        tolerance: Simplification tolerance in degrees
+        max_vertices: Optional maximum number of points to keep per line/ring
+            (at least 4 for polygon rings, so they stay valid closed rings)
+
+    Returns:
+        Simplified and truncated geometry object
+    """
+    coordinates = geometry.get('coordinates', [])
+    simplifier = RING_SIMPLIFIERS.get(geometry.get('type', ''))
+
+    if not coordinates or simplifier is None:
+        # Nothing to simplify (points or empty geometry)
+        return truncate_coordinates(geometry)
+
+    processed_geometry = geometry.copy()
+    processed_geometry['coordinates'] = simplifier(coordinates, tolerance, max_vertices)
+
+    return processed_geometry
+
+def simplify_and_truncate_ring(ring: List[List[float]], tolerance: float,
+                               max_vertices: Optional[int] = None) -> List[List[float]]:
+    """Simplify a single ring or line with Douglas-Peucker, then truncate it to 5 decimal places."""
+    return truncate_ring(douglas_peucker(ring, tolerance, max_vertices))
+
+def polygon_ring_vertex_cap(max_vertices: Optional[int]) -> Optional[int]:
+    """Raise a vertex cap to the 4 positions a closed polygon ring needs (RFC 7946); None stays uncapped."""
+    if max_vertices is None:
+        return None
+    return max(max_vertices, 4)
+
+# Simplify and truncate the rings/lines of each geometry type that Douglas-Peucker applies to
+RING_SIMPLIFIERS = {
+    'LineString': simplify_and_truncate_ring,
+    'Polygon': lambda coordinates, tolerance, max_vertices: [
+        simplify_and_truncate_ring(ring, tolerance, polygon_ring_vertex_cap(max_vertices)) for ring in coordinates
+    ],
+    'MultiLineString': lambda coordinates, tolerance, max_vertices: [
+        simplify_and_truncate_ring(line, tolerance, max_vertices) for line in coordinates
+    ],
+    'MultiPolygon': lambda coordinates, tolerance, max_vertices: [
+        [simplify_and_truncate_ring(ring, tolerance, polygon_ring_vertex_cap(max_vertices)) for ring in polygon]
+        for polygon in coordinates
+    ],
+}
+
+def douglas_peucker(points: List[List[float]], tolerance: float, max_vertices: Optional[int] = None) -> List[List[float]]:
     """
     Douglas-Peucker line simplification algorithm.
 
     Args:
         points: List of [lon, lat] coordinate pairs
         tolerance: Maximum perpendicular distance for point removal
+        max_vertices: Optional maximum number of points to keep (the endpoints are always kept)
 
     Returns:
         Simplified list of coordinate pairs
@@ -868,31 +1115,130 @@ def douglas_peucker(points: List[List[float]], tolerance: float) -> List[List[fl
     if len(points) <= 2:
         return points
 
-    # Find the point with maximum distance from line segment
-    max_distance = 0
-    max_index = 0
+    if max_vertices is not None and len(points) > max_vertices:
+        return douglas_peucker_capped(points, tolerance, max_vertices)
 
-    # Line segment from first to last point
-    start = points[0]
-    end = points[-1]
+    # Iterate over an explicit stack of (start, end) index ranges and mark the
+    # points to keep, instead of recursing on list slices and re-concatenating
+    keep = bytearray(len(points))
+    keep[0] = keep[-1] = 1
+    stack = [(0, len(points) - 1)]
 
-    for i in range(1, len(points) - 1):
-        distance = perpendicular_distance(points[i], start, end)
-        if distance > max_distance:
-            max_distance = distance
-            max_index = i
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2:
+            continue
 
-    # If max distance is greater than tolerance, recursively simplify
-    if max_distance > tolerance:
-        # Recursively simplify the two sub-lines
-        left = douglas_peucker(points[:max_index + 1], tolerance)
-        right = douglas_peucker(points[max_index:], tolerance)
+        # Find the point with maximum distance from line segment
+        max_index, max_distance = find_farthest_point(points, lo, hi)
 
-        # Combine results (avoid duplicate point at max_index)
-        return left[:-1] + right
-    else:
-        # All points between start and end can be removed
-        return [start, end]
+        # If max distance is greater than tolerance, keep it and simplify both sides
+        if max_distance > tolerance and max_index > lo:
+            keep[max_index] = 1
+            stack.append((lo, max_index))
+            stack.append((max_index, hi))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+def douglas_peucker_capped(points: List[List[float]], tolerance: float, max_vertices: int) -> List[List[float]]:
+    """
+    Douglas-Peucker simplification that keeps at most max_vertices points.
+
+    Segments are refined in order of decreasing error using a heap, so when the cap is
+    reached the points kept are the most significant ones. If the cap is never reached
+    the result is the same as douglas_peucker.
+
+    Args:
+        points: List of [lon, lat] coordinate pairs
+        tolerance: Maximum perpendicular distance for point removal
+        max_vertices: Maximum number of points to keep (at least the two endpoints are kept)
+
+    Returns:
+        Simplified list of coordinate pairs
+    """
+    keep = bytearray(len(points))
+    keep[0] = keep[-1] = 1
+    kept_count = 2
+
+    # Max-heap of segments still worth splitting, keyed by their farthest point's distance
+    heap = []
+
+    def push_segment(lo, hi):
+        if hi - lo < 2:
+            return
+        max_index, max_distance = find_farthest_point(points, lo, hi)
+        if max_distance > tolerance and max_index > lo:
+            heapq.heappush(heap, (-max_distance, lo, hi, max_index))
+
+    push_segment(0, len(points) - 1)
+
+    while heap and kept_count < max_vertices:
+        _, lo, hi, max_index = heapq.heappop(heap)
+        keep[max_index] = 1
+        kept_count += 1
+        push_segment(lo, max_index)
+        push_segment(max_index, hi)
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+def find_farthest_point(points: List[List[float]], lo: int, hi: int) -> Tuple[int, float]:
+    """
+    Find the point strictly between points[lo] and points[hi] farthest from the segment joining them.
+
+    Same math as perpendicular_distance, but the segment terms are computed once per
+    segment instead of once per point, and the scan avoids a function call per vertex.
+    The per-point scan first compares the squared distance (or the numerator before
+    dividing by the constant segment length), and only takes the sqrt/division for a
+    point that beats the current maximum there. The winner is still the first point
+    whose actual distance is strictly greater, so candidates that tie after the
+    sqrt/division keep the same vertex as perpendicular_distance would.
+
+    Args:
+        points: List of [lon, lat] coordinate pairs
+        lo: Index of the segment start
+        hi: Index of the segment end
+
+    Returns:
+        (index, distance) of the farthest point, or (0, 0) if no point is farther than 0
+    """
+    x1, y1 = points[lo][0], points[lo][1]
+    x2, y2 = points[hi][0], points[hi][1]
+
+    max_distance = 0
+    max_index = 0
+    # Ranking value (squared distance or numerator) of the current farthest point
+    max_rank = 0
+
+    if x1 == x2 and y1 == y2:
+        # Segment is a point (e.g. a closed ring), use distance to that point
+        for i in range(lo + 1, hi):
+            point = points[i]
+            distance_sq = (point[0] - x1) ** 2 + (point[1] - y1) ** 2
+            if distance_sq > max_rank:
+                distance = math.sqrt(distance_sq)
+                if distance > max_distance:
+                    max_rank = distance_sq
+                    max_distance = distance
+                    max_index = i
+        return max_index, max_distance
+
+    dx = x2 - x1
+    dy = y2 - y1
+    x2_y1 = x2 * y1
+    y2_x1 = y2 * x1
+    denominator = math.sqrt(dy ** 2 + dx ** 2)
+
+    for i in range(lo + 1, hi):
+        point = points[i]
+        numerator = abs(dy * point[0] - dx * point[1] + x2_y1 - y2_x1)
+        if numerator > max_rank:
+            distance = numerator / denominator
+            if distance > max_distance:
+                max_rank = numerator
+                max_distance = distance
+                max_index = i
+
+    return max_index, max_distance
 
 def perpendicular_distance(point: List[float], line_start: List[float], line_end: List[float]) -> float:
     """
@@ -924,6 +1270,7 @@ def perpendicular_distance(point: List[float], line_start: List[float], line_end
 def truncate_coordinates(geometry: Dict[str, Any]) -> Dict[str, Any]:
     """Truncate coordinates to 5 decimal places for ~1m precision (good visual quality)."""
     def truncate_coord_array(coords):
+        # Generic fallback for geometry types without a fixed nesting depth
         if isinstance(coords[0], (int, float)):
             # Single coordinate pair [lon, lat]
             return [round(coords[0], 5), round(coords[1], 5)]
@@ -935,10 +1282,26 @@ def truncate_coordinates(geometry: Dict[str, Any]) -> Dict[str, Any]:
     coordinates = geometry.get('coordinates', [])
 
     if coordinates:
-        truncated_geometry['coordinates'] = truncate_coord_array(coordinates)
+        truncator = COORDINATE_TRUNCATORS.get(geometry.get('type', ''), truncate_coord_array)
+        truncated_geometry['coordinates'] = truncator(coordinates)
 
     return truncated_geometry
 
+def truncate_ring(ring: List[List[float]]) -> List[List[float]]:
+    """Truncate a list of [lon, lat] coordinate pairs to 5 decimal places."""
+    return [[round(coord[0], 5), round(coord[1], 5)] for coord in ring]
+
+# Truncate the coordinates of each geometry type at its known nesting depth, without
+# recursing or type-checking every level
+COORDINATE_TRUNCATORS = {
+    'Point': lambda coordinates: [round(coordinates[0], 5), round(coordinates[1], 5)],
+    'LineString': truncate_ring,
+    'Polygon': lambda coordinates: [truncate_ring(ring) for ring in coordinates],
+    'MultiPoint': truncate_ring,
+    'MultiLineString': lambda coordinates: [truncate_ring(line) for line in coordinates],
+    'MultiPolygon': lambda coordinates: [[truncate_ring(ring) for ring in polygon] for polygon in coordinates],
+}
+
 def simplify_to_rectangle(geometry: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert any polygon to a simple 4-point axis-aligned rectangle.
@@ -959,7 +1322,11 @@ def simplify_to_rectangle(geometry: Dict[str, Any]) -> Dict[str, Any]:
     # Extract all coordinates from the geometry
     all_coords = []
 
-    if geometry_type == 'Polygon':
+    if geometry_type == 'Polygon' and len(coordinates) == 1:
+        # Common case (e.g. toilets): a single ring without holes is used as is, no copy needed
+        all_coords = coordinates[0]
+
+    elif geometry_type == 'Polygon':
         # Extract all coordinates from all rings
         for ring in coordinates:
             all_coords.extend(ring)
@@ -1019,16 +1386,22 @@ def calculate_minimum_bounding_rectangle(coordinates: List[List[float]]) -> List
     if len(coordinates) < 3:
         return coordinates
 
-    # Find the two points that are farthest apart
-    max_distance = 0
+    # Find the two points that are farthest apart. Both always lie on the convex hull,
+    # so only hull vertices (in original order) need to be compared pairwise.
+    # Compare squared distances; sqrt is monotonic and only needed once for the winning pair.
+    hull = [coordinates[i] for i in sorted(convex_hull_indices(coordinates))]
+    max_distance_sq = 0
     p1, p2 = None, None
 
-    for i in range(len(coordinates)):
-        for j in range(i + 1, len(coordinates)):
-            dist = distance(coordinates[i], coordinates[j])
-            if dist > max_distance:
-                max_distance = dist
-                p1, p2 = coordinates[i], coordinates[j]
+    for i in range(len(hull)):
+        ax, ay = hull[i][0], hull[i][1]
+        for j in range(i + 1, len(hull)):
+            dx = hull[j][0] - ax
+            dy = hull[j][1] - ay
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > max_distance_sq:
+                max_distance_sq = dist_sq
+                p1, p2 = hull[i], hull[j]
 
     if p1 is None or p2 is None:
         return calculate_simple_bounding_box(coordinates)
@@ -1092,6 +1465,43 @@ def calculate_minimum_bounding_rectangle(coordinates: List[List[float]]) -> List
 
     return corners
 
+def convex_hull_indices(coordinates: List[List[float]]) -> List[int]:
+    """
+    Find the convex hull of a set of coordinates using Andrew's monotone chain algorithm.
+
+    Args:
+        coordinates: List of [lon, lat] coordinate pairs
+
+    Returns:
+        Indices of the hull vertices (first occurrence of duplicate points), counterclockwise
+    """
+    # Sort by position, keeping the lowest index first among duplicate points
+    order = sorted(range(len(coordinates)), key=lambda i: (coordinates[i][0], coordinates[i][1], i))
+    unique = []
+    for i in order:
+        if not unique or coordinates[i][:2] != coordinates[unique[-1]][:2]:
+            unique.append(i)
+
+    if len(unique) < 3:
+        return unique
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    def half_hull(indices):
+        chain = []
+        for i in indices:
+            while len(chain) >= 2 and cross(coordinates[chain[-2]], coordinates[chain[-1]], coordinates[i]) <= 0:
+                chain.pop()
+            chain.append(i)
+        return chain
+
+    lower = half_hull(unique)
+    upper = half_hull(reversed(unique))
+
+    # Drop the last point of each chain since it is the first point of the other
+    return lower[:-1] + upper[:-1]
+
 def distance(p1: List[float], p2: List[float]) -> float:
     """Calculate Euclidean distance between two points."""
     dx = p2[0] - p1[0]
@@ -1111,11 +1521,11 @@ def calculate_simple_bounding_box(coordinates: List[List[float]]) -> List[List[f
     if len(coordinates) < 3:
         return coordinates
 
-    # Find min/max coordinates
-    min_lon = min(coord[0] for coord in coordinates)
-    max_lon = max(coord[0] for coord in coordinates)
-    min_lat = min(coord[1] for coord in coordinates)
-    max_lat = max(coord[1] for coord in coordinates)
+    # Find min/max coordinates, reducing each column with a single builtin call
+    lons = [coord[0] for coord in coordinates]
+    lats = [coord[1] for coord in coordinates]
+    min_lon, max_lon = min(lons), max(lons)
+    min_lat, max_lat = min(lats), max(lats)
 
     # Create rectangle corners (counterclockwise)
     rectangle = [
@@ -1146,20 +1556,21 @@ def count_geometry_points(coordinates: Any, geometry_type: str) -> int:
     if not coordinates:
         return 0
 
-    if geometry_type == 'Point':
-        return 1
-    elif geometry_type == 'LineString':
-        return len(coordinates)
-    elif geometry_type == 'Polygon':
-        return sum(len(ring) for ring in coordinates)
-    elif geometry_type == 'MultiPoint':
-        return len(coordinates)
-    elif geometry_type == 'MultiLineString':
-        return sum(len(line) for line in coordinates)
-    elif geometry_type == 'MultiPolygon':
-        return sum(sum(len(ring) for ring in polygon) for polygon in coordinates)
+    counter = POINT_COUNTERS.get(geometry_type)
+    if counter is None:
+        return 0
+
+    return counter(coordinates)
 
-    return 0
+# Count the coordinate points of each geometry type
+POINT_COUNTERS = {
+    'Point': lambda coordinates: 1,
+    'LineString': len,
+    'Polygon': lambda coordinates: sum(map(len, coordinates)),
+    'MultiPoint': len,
+    'MultiLineString': lambda coordinates: sum(map(len, coordinates)),
+    'MultiPolygon': lambda coordinates: sum(map(len, chain.from_iterable(coordinates))),
+}
 
 
 output_dir = "./output"
@@ -1170,7 +1581,7 @@ if __name__ == "__main__":
 
     print(f"Output directory: {output_dir}")
 
-    # Check that all input files exist
+    # Check that all input files exist before consolidate_overlays clears the output directory
     missing_files = []
     for overlay_config in OVERLAYS:
         for layer_id, layer_config in overlay_config["layers"].items():